@@ -9,53 +9,21 @@ import sys
 from pathlib import Path
 import shutil
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_SKILL_DIR = _SCRIPT_DIR.parent
 
-def init_pipeline(project_path: Path, videos_path: Path = None):
-    """Initialize video extraction pipeline in project directory."""
-
-    # Create project directory if it doesn't exist
-    project_path.mkdir(parents=True, exist_ok=True)
+# Core files copied into scripts/: (source, destination name)
+_SRC_FILES = [
+    (_SKILL_DIR / "scripts" / "video_extractor.py", "video_extractor.py"),
+    (_SKILL_DIR / "references" / "config_template.yaml", "config.yaml"),
+    (_SKILL_DIR / "assets" / ".env.example", ".env.example"),
+]
 
-    # Create subdirectories
-    scripts_dir = project_path / "scripts"
-    videos_dir = videos_path or (project_path / "videos")
-    output_dir = project_path / "extracted"
+# Upload cache written next to video_extractor.py in scripts/
+_GITIGNORE_ENTRY = "scripts/.upload_cache.json*"
 
-    scripts_dir.mkdir(exist_ok=True)
-    videos_dir.mkdir(exist_ok=True)
-    output_dir.mkdir(exist_ok=True)
-
-    print(f"✓ Created directory structure:")
-    print(f"  - {scripts_dir}")
-    print(f"  - {videos_dir}")
-    print(f"  - {output_dir}")
-
-    # Copy core files (these should be in the same directory as this script)
-    skill_dir = Path(__file__).parent.parent
-
-    # Copy video_extractor.py
-    src_extractor = skill_dir / "scripts" / "video_extractor.py"
-    dst_extractor = scripts_dir / "video_extractor.py"
-    if src_extractor.exists():
-        shutil.copy2(src_extractor, dst_extractor)
-        print(f"✓ Copied video_extractor.py to {dst_extractor}")
-
-    # Copy config template
-    src_config = skill_dir / "references" / "config_template.yaml"
-    dst_config = scripts_dir / "config.yaml"
-    if src_config.exists():
-        shutil.copy2(src_config, dst_config)
-        print(f"✓ Copied config.yaml to {dst_config}")
-
-    # Copy .env.example
-    src_env = skill_dir / "assets" / ".env.example"
-    dst_env = scripts_dir / ".env.example"
-    if src_env.exists():
-        shutil.copy2(src_env, dst_env)
-        print(f"✓ Copied .env.example to {dst_env}")
-
-    # Create README
-    readme_content = f"""# Video Extraction Pipeline
+# README written into every new project; static, so built once at import
+_README_TEMPLATE = """# Video Extraction Pipeline
 
 Extract structured content from videos using Google Gemini API.
 **Supports both local video files and YouTube URLs!**
@@ -140,11 +108,51 @@ python3 video_extractor.py --config custom_config.yaml
 For detailed setup and customization, see the skill documentation.
 """
 
+
+def init_pipeline(project_path: Path, videos_path: Path = None):
+    """Initialize video extraction pipeline in project directory."""
+
+    # Create project directory if it doesn't exist
+    project_path.mkdir(parents=True, exist_ok=True)
+
+    # Create subdirectories
+    scripts_dir = project_path / "scripts"
+    videos_dir = videos_path or (project_path / "videos")
+    output_dir = project_path / "extracted"
+
+    # A custom videos path may coincide with another directory
+    for directory in dict.fromkeys([scripts_dir, videos_dir, output_dir]):
+        directory.mkdir(exist_ok=True)
+
+    print(f"✓ Created directory structure:")
+    print(f"  - {scripts_dir}")
+    print(f"  - {videos_dir}")
+    print(f"  - {output_dir}")
+
+    # Copy core files (missing sources are skipped)
+    # copyfile uses the kernel's zero-copy path (sendfile/CopyFile); copymode
+    # keeps the scripts executable, while timestamps aren't needed in a fresh project
+    for src, dst_name in _SRC_FILES:
+        dst = scripts_dir / dst_name
+        if src.exists():
+            shutil.copyfile(src, dst)
+            shutil.copymode(src, dst)
+            print(f"✓ Copied {dst.name} to {dst}")
+
+    # Create README
     readme_path = project_path / "README.md"
-    with open(readme_path, 'w') as f:
-        f.write(readme_content)
+    readme_path.write_bytes(_README_TEMPLATE.encode('utf-8'))
     print(f"✓ Created README.md at {readme_path}")
 
+    # Keep the upload cache (and its temp file) out of version control
+    gitignore_path = project_path / ".gitignore"
+    existing = gitignore_path.read_text(encoding='utf-8') if gitignore_path.exists() else ""
+    if _GITIGNORE_ENTRY not in existing.splitlines():
+        sep = "\n" if existing and not existing.endswith("\n") else ""
+        with open(gitignore_path, 'a', encoding='utf-8') as f:
+            f.write(f"{sep}{_GITIGNORE_ENTRY}\n")
+        print(f"✓ Added {_GITIGNORE_ENTRY} to {gitignore_path}")
+
     print(f"\n{'='*70}")
     print(f"✓ Video extraction pipeline initialized at: {project_path}")
     print(f"{'='*70}")
@@ -7,74 +7,339 @@ Supports both local video files and YouTube URLs.
 This is a reusable pipeline that can be configured via config.yaml for any video content extraction.
 """
 
+import asyncio
 import os
 import sys
 import time
-import yaml
 import json
 import re
+import string
+import functools
+import hashlib
+import io
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
-from google import genai
-from google.genai import types
+
+# google.genai, yaml, orjson and datetime are imported on first use to keep
+# startup (--help, config errors) fast
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Progress messages of the current video, see VideoExtractor._buffered_output
+_output_buffer: ContextVar[Optional[io.StringIO]] = ContextVar('output_buffer', default=None)
+
+_types = None
+
+
+def _genai_types():
+    """Return the google.genai.types module, importing it on first use."""
+    global _types
+    if _types is None:
+        from google.genai import types
+        _types = types
+    return _types
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to path through a temp file and rename, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temp file behind (e.g. on ENOSPC)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Event loop -> {api_key: client}; see _get_or_create_client
+_CLIENT_CACHE = {}
+# Event loop -> number of batches using its clients; see _client_scope
+_CLIENT_USERS = {}
+
+
+def _get_or_create_client(api_key: str):
+    """
+    Return a Gemini client for api_key, shared by every VideoExtractor running
+    on the current event loop so they reuse one HTTP connection pool.
+    The SDK's async connections are bound to the loop that opened them, so
+    each asyncio.run gets its own client.
+    """
+    from google import genai
+
+    loop = asyncio.get_running_loop()
+    # Clients left behind by a loop that has since closed (used outside
+    # _client_scope); their async side can no longer be awaited.
+    for stale_loop in [l for l in _CLIENT_CACHE if l.is_closed()]:
+        for client in _CLIENT_CACHE.pop(stale_loop).values():
+            client.close()
+
+    clients = _CLIENT_CACHE.setdefault(loop, {})
+    if api_key not in clients:
+        clients[api_key] = genai.Client(api_key=api_key)
+    return clients[api_key]
+
+
+@asynccontextmanager
+async def _client_scope():
+    """
+    Keep the running loop's cached clients open while a batch uses them and
+    close them once the last batch on that loop finishes, before the loop does.
+    """
+    loop = asyncio.get_running_loop()
+    _CLIENT_USERS[loop] = _CLIENT_USERS.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _CLIENT_USERS[loop] -= 1
+        if not _CLIENT_USERS[loop]:
+            del _CLIENT_USERS[loop]
+            for client in _CLIENT_CACHE.pop(loop, {}).values():
+                await client.aio.aclose()
+                client.close()
+
+
+class RateLimiter:
+    """
+    Limiter that spaces API requests by a fixed interval.
+    Unlike sleeping between videos, work already in flight (uploads, other
+    extractions) keeps running while the next request waits for its slot.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = max(float(interval), 0.0)
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        """Wait until the caller may start its next request."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class VideoExtractor:
     """Main class for extracting content from videos using Gemini API."""
 
+    # youtube.com/watch?v=, youtu.be/ and youtube.com/embed/ links
+    _YOUTUBE_URL_RE = re.compile(
+        r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)[\w-]+'
+    )
+
+    # Markdown header written above every extraction
+    _HEADER_TEMPLATE = (
+        "# {title}\n"
+        "\n"
+        "**Section:** {section}\n"
+        "**Extracted:** {date}\n"
+        "**{source_label}:** {source_info}\n"
+        "\n"
+        "---\n"
+    )
+
+    # Persistent upload cache: fingerprint -> Gemini file name (files live 48 hours)
+    UPLOAD_CACHE_SIZE = 500
+    FINGERPRINT_CHUNK = 1024 * 1024
+
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize the video extractor with configuration."""
         self.config = self._load_config(config_path)
-        self._setup_gemini()
+        self.model_name = self.config.get('model', 'gemini-1.5-pro')
+        self._partial_prompt = self._compile_template()
+        self._api_key = None  # Resolved on first use, see client property
         self.uploaded_files = {}  # Cache of uploaded file URIs
+        self._cache_path = _SCRIPT_DIR / ".upload_cache.json"
+        self._upload_cache = self._load_upload_cache()
+        self.max_concurrency = max(1, int(self.config.get('max_concurrency', 1)))
+        self._pipelining = False  # True while a batch overlaps uploads with extraction
+        self.rate_limiter = RateLimiter(self.config.get('rate_limit_delay', 2))
+        self._ensured_dirs = set()  # Output directories already created
 
     def _load_config(self, config_path: str) -> Dict:
-        """Load configuration from YAML file."""
-        config_file = Path(__file__).parent / config_path
+        """Load configuration from YAML file (or JSON if it ends in .json)."""
+        config_file = _SCRIPT_DIR / config_path
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
 
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        data = config_file.read_bytes()
+        if config_file.suffix == '.json':
+            try:
+                import orjson
+            except ImportError:
+                return json.loads(data)
+            return orjson.loads(data)
+
+        import yaml
+
+        # Prefer libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        return yaml.load(data, Loader=loader)
+
+    @property
+    def client(self):
+        """
+        Gemini client for the running event loop, created on first access.
+        Must be accessed from a coroutine; raises RuntimeError without a
+        running event loop.
+        """
+        if self._api_key is None:
+            self._api_key = self._setup_gemini()
+        return _get_or_create_client(self._api_key)
 
-    def _setup_gemini(self):
-        """Configure Gemini API with API key."""
+    def _setup_gemini(self) -> str:
+        """Resolve and validate the Gemini API key."""
         api_key = os.getenv('GEMINI_API_KEY') or self.config.get('api_key')
         if not api_key:
             raise ValueError(
                 "GEMINI_API_KEY not found. Set it as environment variable or in config.yaml"
             )
 
-        # Initialize client with the new API
-        self.client = genai.Client(api_key=api_key)
-
-        # Store model name for later use
-        self.model_name = self.config.get('model', 'gemini-1.5-pro')
         print(f"✓ Using model: {self.model_name}")
+        return api_key
 
-    @staticmethod
-    def _is_youtube_url(url: str) -> bool:
+    @classmethod
+    def _is_youtube_url(cls, url: str) -> bool:
         """Check if the given string is a YouTube URL."""
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-        ]
-        return any(re.match(pattern, url) for pattern in youtube_patterns)
-
-    def create_youtube_video_object(self, youtube_url: str, display_name: Optional[str] = None):
+        return cls._YOUTUBE_URL_RE.match(url) is not None
+
+    @contextmanager
+    def _capture_output(self, buffer: io.StringIO):
+        """Route the current task's progress messages into buffer."""
+        token = _output_buffer.set(buffer)
+        try:
+            yield
+        finally:
+            _output_buffer.reset(token)
+
+    @contextmanager
+    def _buffered_output(self, buffer: Optional[io.StringIO] = None):
+        """
+        Collect the current task's progress messages (appending to buffer if
+        given) and write them to stdout in one call on exit, so concurrent
+        videos don't interleave line by line.
+        """
+        if _output_buffer.get() is not None:
+            yield  # Already buffering, e.g. process_video called from process_batch
+            return
+
+        buffer = buffer or io.StringIO()
+        try:
+            with self._capture_output(buffer):
+                yield
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    def _log(self, message: str = "", end: str = "\n"):
+        """Print a progress message, through the task's buffer if one is active."""
+        buffer = _output_buffer.get()
+        if buffer is None:
+            print(message, end=end)
+        else:
+            buffer.write(message + end)
+
+    @property
+    def _live_progress(self) -> bool:
+        """Whether progress markers can be shown live without interleaving."""
+        return self.max_concurrency == 1 and not self._pipelining
+
+    def _log_progress(self, marker: str):
+        """Show a live progress marker; skipped when videos run in parallel."""
+        if not self._live_progress:
+            return
+        self._log(marker, end="")
+        buffer = _output_buffer.get()
+        if buffer is not None:
+            sys.stdout.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        sys.stdout.flush()
+
+    def _load_upload_cache(self) -> OrderedDict:
+        """Load the on-disk upload cache, oldest entries first."""
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        # A valid but non-object file (e.g. a list) is treated as empty
+        return OrderedDict(data) if isinstance(data, dict) else OrderedDict()
+
+    def _save_upload_cache(self):
+        """Atomically persist the upload cache."""
+        try:
+            _write_atomic(self._cache_path, json.dumps(self._upload_cache).encode('utf-8'))
+        except OSError as e:
+            self._log(f"  Warning: could not save upload cache: {e}")
+
+    def _fingerprint(self, video_file: Path) -> str:
+        """Cheap content key: hash of the first and last MiB plus size and mtime."""
+        stat = video_file.stat()
+        digest = hashlib.sha256()
+        with open(video_file, 'rb') as f:
+            digest.update(f.read(self.FINGERPRINT_CHUNK))
+            if stat.st_size > self.FINGERPRINT_CHUNK:
+                f.seek(max(stat.st_size - self.FINGERPRINT_CHUNK, self.FINGERPRINT_CHUNK))
+                digest.update(f.read(self.FINGERPRINT_CHUNK))
+        return f"{digest.hexdigest()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    async def _get_cached_upload(self, fingerprint: str):
+        """Return the still-active Gemini file for fingerprint, evicting stale entries."""
+        types = _genai_types()
+        file_name = self._upload_cache.get(fingerprint)
+        if file_name is None:
+            return None
+
+        from google.genai import errors
+
+        try:
+            video_file_obj = await self.client.aio.files.get(name=file_name)
+        except errors.ClientError as e:
+            if e.code not in (403, 404):
+                raise
+            video_file_obj = None  # Expired, deleted, or owned by another API key
+
+        if video_file_obj is None or video_file_obj.state != types.FileState.ACTIVE:
+            self._upload_cache.pop(fingerprint, None)
+            self._save_upload_cache()
+            return None
+        self._upload_cache.move_to_end(fingerprint)
+        return video_file_obj
+
+    def _cache_upload(self, fingerprint: str, video_file_obj):
+        """Record an uploaded file in the on-disk cache, evicting the oldest entries."""
+        self._upload_cache[fingerprint] = video_file_obj.name
+        self._upload_cache.move_to_end(fingerprint)
+        while len(self._upload_cache) > self.UPLOAD_CACHE_SIZE:
+            self._upload_cache.popitem(last=False)
+        self._save_upload_cache()
+
+    async def create_youtube_video_object(self, youtube_url: str, display_name: Optional[str] = None):
         """
         Create a video object for YouTube URL (no upload needed).
         Gemini API can process YouTube URLs directly.
         Returns a simple object with the YouTube URL.
         """
         # Check if already cached
-        if youtube_url in self.uploaded_files:
-            print(f"  Using cached YouTube URL: {youtube_url}")
-            return self.uploaded_files[youtube_url]
+        cached = self.uploaded_files.get(youtube_url)
+        if cached is not None:
+            self._log(f"  Using cached YouTube URL: {youtube_url}")
+            return cached
 
-        print(f"  Using YouTube URL: {youtube_url}")
+        self._log(f"  Using YouTube URL: {youtube_url}")
 
         # Create a simple object to hold YouTube video info
         # Gemini processes YouTube URLs directly without uploading
@@ -87,72 +352,113 @@ class VideoExtractor:
 
         video_obj = YouTubeVideo(youtube_url, display_name)
 
-        print(f"  ✓ YouTube video ready")
+        self._log(f"  ✓ YouTube video ready")
 
         # Cache the video object
         self.uploaded_files[youtube_url] = video_obj
         return video_obj
 
-    def upload_video(self, video_path: str, display_name: Optional[str] = None) -> str:
+    async def upload_video(self, video_path: str, display_name: Optional[str] = None) -> str:
         """
         Upload video to Gemini Files API.
         Returns the file object that can be reused for 48 hours.
         """
+        types = _genai_types()
         video_file = Path(video_path)
         if not video_file.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         # Check if already uploaded
-        if video_path in self.uploaded_files:
-            print(f"  Using cached upload for: {video_file.name}")
-            return self.uploaded_files[video_path]
+        cached = self.uploaded_files.get(video_path)
+        if cached is not None:
+            self._log(f"  Using cached upload for: {video_file.name}")
+            return cached
+
+        # Check if uploaded by a previous run and still alive on the server
+        fingerprint = await asyncio.to_thread(self._fingerprint, video_file)
+        video_file_obj = await self._get_cached_upload(fingerprint)
+        if video_file_obj is not None:
+            self._log(f"  Using previous upload for: {video_file.name}")
+            self.uploaded_files[video_path] = video_file_obj
+            return video_file_obj
 
         # Upload file
-        print(f"  Uploading: {video_file.name} ({self._format_size(video_file.stat().st_size)})")
+        size_bytes = video_file.stat().st_size
+        self._log(f"  Uploading: {video_file.name} ({self._format_size(size_bytes)})")
 
         display_name = display_name or video_file.stem
 
-        # Use new API: client.files.upload()
-        with open(video_file, 'rb') as f:
-            video_file_obj = self.client.files.upload(
-                file=f,
-                config={
-                    'display_name': display_name,
-                    'mime_type': 'video/mp4'
-                }
-            )
+        # Use new API: client.aio.files.upload()
+        # Pass the path so the SDK opens the file and reads it in its own
+        # resumable-upload chunk size rather than through our file object
+        client = self.client
+        started = time.monotonic()
+        video_file_obj = await client.aio.files.upload(
+            file=str(video_file),
+            config={
+                'display_name': display_name,
+                'mime_type': 'video/mp4'
+            }
+        )
+        elapsed = max(time.monotonic() - started, 1e-6)
 
-        print(f"  Upload complete. Processing video...")
+        self._log(f"  Upload complete ({self._format_size(size_bytes / elapsed)}/s). Processing video...")
 
-        # Wait for processing to complete
+        # Wait for processing to complete, backing off between status checks
+        delay = 0.5
+        deadline = time.monotonic() + self.config.get('upload_timeout_s', 600)
         while video_file_obj.state == types.FileState.PROCESSING:
-            print("  .", end="", flush=True)
-            time.sleep(2)
-            video_file_obj = self.client.files.get(name=video_file_obj.name)
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Video processing timed out: {video_file_obj.name}")
+            self._log_progress("  .")
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, 10.0)
+            video_file_obj = await client.aio.files.get(name=video_file_obj.name)
 
-        print()  # New line after dots
+        if self._live_progress:
+            self._log()  # New line after dots
 
         if video_file_obj.state == types.FileState.FAILED:
             raise Exception(f"Video processing failed: {video_file_obj.state}")
 
-        print(f"  ✓ Video ready: {video_file_obj.name}")
+        self._log(f"  ✓ Video ready: {video_file_obj.name}")
 
         # Cache the file object
         self.uploaded_files[video_path] = video_file_obj
+        self._cache_upload(fingerprint, video_file_obj)
         return video_file_obj
 
-    def extract_content(self, video_file_obj, video_metadata: Dict) -> str:
+    @functools.cached_property
+    def _gen_config(self):
+        """Generation config shared by every extraction (safety filters off)."""
+        types = _genai_types()
+        return types.GenerateContentConfig(
+            safety_settings=[
+                types.SafetySetting(category=category, threshold='BLOCK_NONE')
+                for category in (
+                    'HARM_CATEGORY_HATE_SPEECH',
+                    'HARM_CATEGORY_HARASSMENT',
+                    'HARM_CATEGORY_SEXUALLY_EXPLICIT',
+                    'HARM_CATEGORY_DANGEROUS_CONTENT',
+                )
+            ]
+        )
+
+    async def extract_content(self, video_file_obj, video_metadata: Dict) -> str:
         """
         Extract structured content from video using Gemini.
         Returns markdown-formatted content.
         """
+        types = _genai_types()
         prompt = self._build_extraction_prompt(video_metadata)
 
-        print(f"  Extracting content with Gemini...")
+        # rate_limit_delay is the spacing between generate_content requests
+        await self.rate_limiter.acquire()
+        self._log(f"  Extracting content with Gemini...")
 
         try:
-            # Use new API: client.models.generate_content()
-            response = self.client.models.generate_content(
+            # Use new API: client.aio.models.generate_content()
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=[
                     types.Part.from_uri(
@@ -161,131 +467,254 @@ class VideoExtractor:
                     ),
                     prompt
                 ],
-                config=types.GenerateContentConfig(
-                    safety_settings=[
-                        types.SafetySetting(
-                            category='HARM_CATEGORY_HATE_SPEECH',
-                            threshold='BLOCK_NONE'
-                        ),
-                        types.SafetySetting(
-                            category='HARM_CATEGORY_HARASSMENT',
-                            threshold='BLOCK_NONE'
-                        ),
-                        types.SafetySetting(
-                            category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
-                            threshold='BLOCK_NONE'
-                        ),
-                        types.SafetySetting(
-                            category='HARM_CATEGORY_DANGEROUS_CONTENT',
-                            threshold='BLOCK_NONE'
-                        ),
-                    ]
-                )
+                config=self._gen_config
             )
 
             if not response.text:
                 raise Exception("Empty response from Gemini")
 
-            print(f"  ✓ Content extracted ({len(response.text)} chars)")
+            self._log(f"  ✓ Content extracted ({len(response.text)} chars)")
             return response.text
 
         except Exception as e:
-            print(f"  ✗ Extraction failed: {e}")
+            self._log(f"  ✗ Extraction failed: {e}")
             raise
 
-    def _build_extraction_prompt(self, video_metadata: Dict) -> str:
-        """Build the extraction prompt based on video metadata and config."""
+    def _compile_template(self) -> str:
+        """
+        Bind the batch-wide placeholders of the prompt template once.
+        Leaves {title} and {section} for _build_extraction_prompt and
+        surfaces bad placeholders at startup instead of mid-batch.
+        """
         template = self.config.get('prompt_template', '')
+        batch_values = {
+            'course_context': self.config.get('course_context', ''),
+            'output_format': self.config.get('output_format', ''),
+        }
+
+        def escape(value: str) -> str:
+            # The result is formatted again per video, so keep these braces literal
+            return value.replace('{', '{{').replace('}', '}}')
+
+        parts = []
+        try:
+            for literal, field, spec, conversion in string.Formatter().parse(template):
+                parts.append(escape(literal))
+                if field is None:
+                    continue
+
+                placeholder = '{' + field
+                if conversion:
+                    placeholder += '!' + conversion
+                if spec:
+                    placeholder += ':' + spec
+                placeholder += '}'
+
+                if field in batch_values:
+                    parts.append(escape(placeholder.format(**batch_values)))
+                elif field in ('title', 'section'):
+                    parts.append(placeholder)
+                else:
+                    raise KeyError(field)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid prompt_template placeholder: {e}") from e
+
+        return ''.join(parts)
 
-        # Replace placeholders in template
-        prompt = template.format(
+    def _build_extraction_prompt(self, video_metadata: Dict) -> str:
+        """Build the extraction prompt based on video metadata and config."""
+        return self._partial_prompt.format(
             title=video_metadata.get('title', 'Unknown'),
-            section=video_metadata.get('section', 'Unknown'),
-            course_context=self.config.get('course_context', ''),
-            output_format=self.config.get('output_format', '')
+            section=video_metadata.get('section', 'Unknown')
         )
 
-        return prompt
-
     def save_markdown(self, content: str, output_path: str, video_metadata: Dict):
         """Save extracted content as markdown file with metadata header."""
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_file.parent)
 
         # Add metadata header
         header = self._generate_metadata_header(video_metadata)
         full_content = f"{header}\n\n{content}"
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_content)
+        _write_atomic(output_file, full_content.encode('utf-8'))
 
-        print(f"  ✓ Saved to: {output_file}")
+        self._log(f"  ✓ Saved to: {output_file}")
+
+    def _ensure_dir(self, directory: Path):
+        """Create directory (and parents) once per extractor."""
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
 
     def _generate_metadata_header(self, video_metadata: Dict) -> str:
         """Generate YAML frontmatter for markdown file."""
+        from datetime import datetime
+
         # Determine if it's a YouTube video or local file
         source_info = video_metadata.get('youtube_url') or video_metadata.get('filename', 'Unknown')
         source_label = "YouTube URL" if video_metadata.get('youtube_url') else "Video File"
 
-        header = f"""# {video_metadata.get('title', 'Untitled')}
-
-**Section:** {video_metadata.get('section', 'Unknown Section')}
-**Extracted:** {datetime.now().strftime('%Y-%m-%d')}
-**{source_label}:** {source_info}
+        return self._HEADER_TEMPLATE.format(
+            title=video_metadata.get('title', 'Untitled'),
+            section=video_metadata.get('section', 'Unknown Section'),
+            date=datetime.now().strftime('%Y-%m-%d'),
+            source_label=source_label,
+            source_info=source_info
+        )
 
----
-"""
-        return header
+    @staticmethod
+    def _describe_video(video_config: Dict) -> Tuple[str, str]:
+        """Return (source, title) for a video config, which must have a source."""
+        # Validate that we have either youtube_url or path
+        video_source = video_config.get('youtube_url') or video_config.get('path')
+        if not video_source:
+            raise ValueError("Video config must specify either 'youtube_url' or 'path'")
+        return video_source, video_config.get('title', video_source)
 
-    def process_video(self, video_config: Dict) -> bool:
+    def _validate_videos(self, videos: List[Dict]):
         """
-        Process a single video: upload/prepare, extract, save.
-        Supports both local files (path) and YouTube URLs (youtube_url).
-        Returns True if successful, False otherwise.
+        Check every video config before any upload or API call, so one bad
+        entry doesn't surface only after earlier videos have used up quota.
+        Raises ValueError listing all problems found.
         """
-        # Determine if it's a YouTube URL or local file
-        youtube_url = video_config.get('youtube_url')
-        video_path = video_config.get('path')
-        output_path = video_config['output']
+        writable_dirs = {}  # Output directory -> writable, checked once per directory
+        errors = []
 
-        # Validate that we have either youtube_url or path
-        if not youtube_url and not video_path:
-            raise ValueError("Video config must specify either 'youtube_url' or 'path'")
+        for index, video_config in enumerate(videos, 1):
+            youtube_url = video_config.get('youtube_url')
+            video_path = video_config.get('path')
+            output_path = video_config.get('output')
+            name = video_config.get('title') or youtube_url or video_path or video_config.get('id')
+            label = f"[{index}] {name}" if name else f"[{index}]"
 
-        video_source = youtube_url or video_path
-        video_title = video_config.get('title', video_source)
+            if youtube_url:
+                if not self._is_youtube_url(youtube_url):
+                    errors.append(f"{label}: not a YouTube URL: {youtube_url}")
+            elif video_path:
+                if not Path(video_path).is_file():
+                    errors.append(f"{label}: video file not found: {video_path}")
+                elif not os.access(video_path, os.R_OK):
+                    errors.append(f"{label}: video file not readable: {video_path}")
+            else:
+                errors.append(f"{label}: must specify either 'youtube_url' or 'path'")
 
-        print(f"\n{'='*70}")
-        print(f"Processing: {video_title}")
-        print(f"{'='*70}")
+            if not output_path:
+                errors.append(f"{label}: missing 'output' path")
+            else:
+                output_dir = Path(output_path).parent
+                if output_dir not in writable_dirs:
+                    writable_dirs[output_dir] = self._is_writable_dir(output_dir)
+                if not writable_dirs[output_dir]:
+                    errors.append(f"{label}: output directory not writable: {output_dir}")
+
+        if errors:
+            raise ValueError(
+                f"Invalid video config ({len(errors)} problems):\n  " + "\n  ".join(errors)
+            )
+
+    @staticmethod
+    def _is_writable_dir(directory: Path) -> bool:
+        """Whether directory exists and is writable, or could be created in its nearest existing parent."""
+        while not directory.exists() and directory != directory.parent:
+            directory = directory.parent
+        return directory.is_dir() and os.access(directory, os.W_OK | os.X_OK)
+
+    def _log_video_header(self, video_title: str):
+        """Log the banner that starts a video's progress output."""
+        self._log(f"\n{'='*70}")
+        self._log(f"Processing: {video_title}")
+        self._log(f"{'='*70}")
+
+    async def _prepare_video(self, video_config: Dict):
+        """Upload a local video or wrap a YouTube URL, ready for extraction."""
+        youtube_url = video_config.get('youtube_url')
+        if youtube_url:
+            return await self.create_youtube_video_object(
+                youtube_url,
+                display_name=video_config.get('title')
+            )
+        return await self.upload_video(
+            video_config['path'],
+            display_name=video_config.get('title')
+        )
+
+    async def _complete_video(self, video_config: Dict, prepared) -> bool:
+        """
+        Extract and save a prepared video, or report why preparing it failed.
+        prepared is the result of _prepare_video or the exception it raised.
+        """
+        video_source = video_config.get('youtube_url') or video_config.get('path')
+        video_title = video_config.get('title', video_source)
 
         try:
-            # Handle YouTube URL or local file
-            if youtube_url:
-                video_file_obj = self.create_youtube_video_object(
-                    youtube_url,
-                    display_name=video_config.get('title')
-                )
-            else:
-                video_file_obj = self.upload_video(
-                    video_path,
-                    display_name=video_config.get('title')
-                )
+            if isinstance(prepared, Exception):
+                raise prepared
 
             # Extract content
-            content = self.extract_content(video_file_obj, video_config)
+            content = await self.extract_content(prepared, video_config)
 
             # Save markdown
-            self.save_markdown(content, output_path, video_config)
+            self.save_markdown(content, video_config['output'], video_config)
 
-            print(f"✓ Successfully processed: {video_title}")
+            self._log(f"✓ Successfully processed: {video_title}")
             return True
 
         except Exception as e:
-            print(f"✗ Failed to process {video_source}: {e}")
+            self._log(f"✗ Failed to process {video_source}: {e}")
             return False
 
-    def process_batch(self, video_list: Optional[List[str]] = None) -> Dict:
+    async def process_video(self, video_config: Dict) -> bool:
+        """
+        Process a single video: upload/prepare, extract, save.
+        Supports both local files (path) and YouTube URLs (youtube_url).
+        Returns True if successful, False otherwise.
+        """
+        video_source, video_title = self._describe_video(video_config)
+
+        async with _client_scope():
+            with self._buffered_output():
+                self._log_video_header(video_title)
+
+                try:
+                    prepared = await self._prepare_video(video_config)
+                except Exception as e:
+                    prepared = e
+
+                return await self._complete_video(video_config, prepared)
+
+    async def _process_pipelined(self, videos: List[Dict]) -> List[bool]:
+        """
+        Process videos one at a time, in order, while uploading the next video
+        in the background so upload time hides behind extraction time.
+        """
+        queue = asyncio.Queue(maxsize=1)
+
+        async def uploader():
+            for index, video_config in enumerate(videos, 1):
+                buffer = io.StringIO()
+                with self._capture_output(buffer):
+                    self._log(f"\n[{index}/{len(videos)}]", end=" ")
+                    try:
+                        _, video_title = self._describe_video(video_config)
+                        self._log_video_header(video_title)
+                        prepared = await self._prepare_video(video_config)
+                    except Exception as e:
+                        prepared = e
+                await queue.put((video_config, buffer, prepared))
+
+        producer = asyncio.create_task(uploader())
+        outcomes = []
+        try:
+            for _ in videos:
+                video_config, buffer, prepared = await queue.get()
+                with self._buffered_output(buffer):
+                    outcomes.append(await self._complete_video(video_config, prepared))
+        finally:
+            producer.cancel()
+        return outcomes
+
+    async def process_batch(self, video_list: Optional[List[str]] = None) -> Dict:
         """
         Process multiple videos from config.
         If video_list provided, only process those videos.
@@ -295,40 +724,66 @@ class VideoExtractor:
 
         if video_list:
             # Filter to only requested videos (by path, youtube_url, or id)
-            videos = [v for v in videos if
-                     v.get('path') in video_list or
-                     v.get('youtube_url') in video_list or
-                     v.get('id') in video_list]
+            selector = set(video_list)
+            videos = [v for v in videos
+                      if not selector.isdisjoint((v.get('path'), v.get('youtube_url'), v.get('id')))]
 
         if not videos:
             print("No videos to process.")
             return {'total': 0, 'success': 0, 'failed': 0}
 
+        # Catch missing files and bad outputs before paying for any uploads
+        self._validate_videos(videos)
+
+        # Fail fast on a missing API key before dispatching any videos
+        if self._api_key is None:
+            self._api_key = self._setup_gemini()
+
+        # Create each output directory once instead of per video
+        for output_dir in {Path(v['output']).parent for v in videos}:
+            self._ensure_dir(output_dir)
+
         print(f"\n{'='*70}")
         print(f"BATCH PROCESSING: {len(videos)} videos")
         print(f"{'='*70}")
 
         results = {'total': len(videos), 'success': 0, 'failed': 0, 'errors': []}
 
-        for i, video_config in enumerate(videos, 1):
-            print(f"\n[{i}/{len(videos)}]", end=" ")
+        async with _client_scope():
+            if self.max_concurrency == 1:
+                self._pipelining = True
+                try:
+                    outcomes = await self._process_pipelined(videos)
+                finally:
+                    self._pipelining = False
+            else:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+
+                async def run(index: int, video_config: Dict) -> bool:
+                    async with semaphore:
+                        with self._buffered_output():
+                            self._log(f"\n[{index}/{len(videos)}]", end=" ")
+                            return await self.process_video(video_config)
+
+                outcomes = await asyncio.gather(
+                    *(run(i, video_config) for i, video_config in enumerate(videos, 1)),
+                    return_exceptions=True
+                )
 
-            success = self.process_video(video_config)
+        for video_config, outcome in zip(videos, outcomes):
+            video_source = video_config.get('youtube_url') or video_config.get('path')
+            if isinstance(outcome, BaseException):
+                print(f"✗ Failed to process {video_source}: {outcome}")
 
-            if success:
+            if outcome is True:
                 results['success'] += 1
             else:
                 results['failed'] += 1
-                video_source = video_config.get('youtube_url') or video_config.get('path')
                 results['errors'].append({
                     'video': video_config.get('title', video_source),
                     'source': video_source
                 })
 
-            # Respect rate limits
-            if i < len(videos):
-                time.sleep(self.config.get('rate_limit_delay', 2))
-
         self._print_summary(results)
         return results
 
@@ -366,7 +821,7 @@ def main():
     parser.add_argument(
         '--config',
         default='config.yaml',
-        help='Path to configuration file (default: config.yaml)'
+        help='Path to YAML or JSON configuration file (default: config.yaml)'
     )
     parser.add_argument(
         '--videos',
@@ -392,7 +847,11 @@ def main():
         sys.exit(1)
 
     # Process videos
-    results = extractor.process_batch(video_list=args.videos)
+    try:
+        results = asyncio.run(extractor.process_batch(video_list=args.videos))
+    except Exception as e:
+        print(f"Error processing videos: {e}")
+        sys.exit(1)
 
     # Exit with error code if any failed
     if results['failed'] > 0: